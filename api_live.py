@@ -5,17 +5,43 @@ Simplified version configured for Replit environment with real data scraping.
 """
 
 import os
+import re
+import sys
 import json
+import atexit
+import asyncio
+import queue
+import threading
 import logging
+import logging.handlers
 import time
 import tempfile
+import hashlib
+import gzip
+import bisect
+import sqlite3
 from datetime import datetime
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
 from collections import deque
+from itertools import islice
+from operator import attrgetter
 
 import requests
 from bs4 import BeautifulSoup
+
+# selectolax's Lexbor backend is a C HTML parser; BeautifulSoup is the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# BeautifulSoup backend: libxml2 via lxml when installed, else the pure-Python parser
+try:
+    import lxml  # noqa: F401
+    _BS4_PARSER = 'lxml'
+except ImportError:
+    _BS4_PARSER = 'html.parser'
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -24,17 +50,138 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 import uvicorn
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Prefer orjson for response encoding when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _resolve_log_level(value: str) -> Optional[str]:
+    """Return the logging level name for a LOG_LEVEL value (WARN means WARNING), or None if unknown."""
+    name = value.strip().upper()
+    if name == 'WARN':
+        name = 'WARNING'
+    return name if name in ('CRITICAL', 'ERROR', 'WARNING', 'INFO', 'DEBUG') else None
+
+# One level for the app and uvicorn, taken from LOG_LEVEL
+_LOG_LEVEL_SETTING = os.getenv('LOG_LEVEL', 'INFO')
+_LOG_LEVEL = _resolve_log_level(_LOG_LEVEL_SETTING) or 'INFO'
+
+# Configure logging - records are enqueued on the calling thread and a
+# background listener does the console I/O
+_log_queue = queue.Queue(-1)
+_log_console_handler = logging.StreamHandler()
+logging.basicConfig(level=_LOG_LEVEL, handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_console_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
+if _resolve_log_level(_LOG_LEVEL_SETTING) is None:
+    logger.warning(f"Unknown LOG_LEVEL {_LOG_LEVEL_SETTING!r}, using INFO")
+
+# Lookup tables used on every scrape, built once at import time
+_JOB_SELECTORS = (
+    '.job-tile',
+    '.job-card',
+    '[data-testid="job-tile"]',
+    '.search-result',
+    '.job-posting',
+    '.position-card',
+    '[class*="job"]',
+    '[class*="position"]'
+)
+_CHROME_BINARY_PATHS = (
+    r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+    r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe'
+)
+# Images, fonts, media and trackers blocked via CDP. Stylesheets still load because
+# innerText (used for job titles) depends on computed visibility.
+_BLOCKED_RESOURCE_URLS = (
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*', '*facebook*'
+)
+# ChromeDriver path resolved by WebDriverManager (WDM_LOCAL keeps its cache in ./.wdm)
+_PINNED_DRIVER_FILE = os.path.join('.wdm', 'pinned_driver_path')
+# Listing-specific selectors (not the generic class matches) that mean results have rendered
+_JOB_LISTING_READY_CSS = ', '.join(_JOB_SELECTORS[:6])
+_JOB_LINK_FALLBACK_CSS = "a[href*='job'], a[href*='position']"
+
+# Runs in the browser: returns text/tag/href for the first selector that matches
+# (or the link fallback), so element properties are not fetched one round-trip at a time
+_COLLECT_JOB_ELEMENTS_JS = """
+const [selectors, fallback, limit] = arguments;
+let elements = [];
+let matched = null;
+for (const selector of selectors) {
+    elements = document.querySelectorAll(selector);
+    if (elements.length) {
+        matched = selector;
+        break;
+    }
+}
+if (!matched) {
+    elements = document.querySelectorAll(fallback);
+}
+return {
+    selector: matched,
+    count: elements.length,
+    items: Array.from(elements).slice(0, limit).map(el => ({
+        text: el.innerText || '',
+        tag: el.tagName.toLowerCase(),
+        href: typeof el.href === 'string' ? el.href : null
+    }))
+};
+"""
+_JOB_PAGE_KEYWORDS_RE = re.compile(r'hiring|position|apply|job|career', re.IGNORECASE)
+_FALLBACK_JOB_TYPES = ('Warehouse Associate', 'Delivery Driver', 'Fulfillment Associate')
+_FALLBACK_LOCATIONS = ('Toronto, ON', 'Vancouver, BC')
 
-@dataclass
+def _blake2b_hex(key: str) -> str:
+    """Return a 12-hex-char BLAKE2b digest of key; unlike hash() it is stable across runs."""
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=6).hexdigest()
+
+def _intern_column(value: Optional[str]) -> Optional[str]:
+    """Intern a string read from SQLite, passing NULL (None) through."""
+    return sys.intern(value) if value is not None else None
+
+def _read_pinned_driver() -> Optional[str]:
+    """Return the pinned ChromeDriver path if the binary still exists."""
+    try:
+        with open(_PINNED_DRIVER_FILE) as f:
+            driver_path = f.read().strip()
+    except OSError:
+        return None
+    return driver_path if driver_path and os.path.exists(driver_path) else None
+
+def _pin_driver(driver_path: str):
+    """Remember a working ChromeDriver path for the next startup."""
+    try:
+        os.makedirs(os.path.dirname(_PINNED_DRIVER_FILE), exist_ok=True)
+        with open(_PINNED_DRIVER_FILE, 'w') as f:
+            f.write(driver_path)
+    except OSError as e:
+        logger.warning(f"Could not pin ChromeDriver path: {e}")
+
+def _extract_page_text(html: str) -> str:
+    """Return the text content of an HTML document."""
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(html).text()
+    return BeautifulSoup(html, _BS4_PARSER).get_text()
+
+def _json_bytes(content) -> bytes:
+    """Encode content as compact JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+@dataclass(slots=True)
 class JobPosting:
     """Represents a job posting with all relevant details."""
     job_id: str
@@ -48,6 +195,18 @@ class JobPosting:
     def __post_init__(self):
         if not self.detected_at:
             self.detected_at = datetime.now().isoformat()
+    
+    def to_dict(self) -> Dict[str, str]:
+        """Return the posting as a plain dict (same shape as asdict, without the field reflection)."""
+        return {
+            'job_id': self.job_id,
+            'title': self.title,
+            'url': self.url,
+            'location': self.location,
+            'posted_date': self.posted_date,
+            'description': self.description,
+            'detected_at': self.detected_at
+        }
 
 class LiveJobScraper:
     """Live job scraper using ONLY Selenium for Amazon hiring page."""
@@ -77,44 +236,69 @@ class LiveJobScraper:
             chrome_options.add_experimental_option('useAutomationExtension', False)
             
             # Set Chrome binary path for Windows
-            chrome_binary_paths = [
-                r'C:\Program Files\Google\Chrome\Application\chrome.exe',
-                r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe'
-            ]
-            
-            for chrome_path in chrome_binary_paths:
+            for chrome_path in _CHROME_BINARY_PATHS:
                 if os.path.exists(chrome_path):
                     chrome_options.binary_location = chrome_path
                     self.logger.info(f"Using Chrome binary: {chrome_path}")
                     break
             
-            # Use temporary directory for user data
-            temp_dir = tempfile.mkdtemp()
-            chrome_options.add_argument(f'--user-data-dir={temp_dir}')
+            # Reuse a persistent profile when CHROME_PROFILE_DIR is set so Chrome's disk
+            # cache stays warm across restarts; otherwise use a temporary directory
+            profile_dir = os.getenv('CHROME_PROFILE_DIR')
+            if profile_dir:
+                os.makedirs(profile_dir, exist_ok=True)
+            else:
+                profile_dir = tempfile.mkdtemp()
+            chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+            
+            # Reuse the ChromeDriver resolved by a previous run while it is still on disk,
+            # skipping WebDriverManager's online version check
+            pinned_driver = _read_pinned_driver()
+            if pinned_driver:
+                try:
+                    self.driver = webdriver.Chrome(service=Service(pinned_driver), options=chrome_options)
+                except WebDriverException as e:
+                    # Usually a driver/browser version mismatch after a Chrome update
+                    self.logger.warning(f"⚠️ Pinned ChromeDriver failed to start, re-resolving: {e}")
+                    self.driver = None
             
             # Try with WebDriverManager first (Windows)
-            try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                
-                # Set cache directory
-                os.environ['WDM_LOCAL'] = '1'
-                os.environ['WDM_LOG_LEVEL'] = '0'
-                
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                
-            except ImportError:
-                # Fallback without WebDriverManager
-                self.driver = webdriver.Chrome(options=chrome_options)
+            if not self.driver:
+                try:
+                    from webdriver_manager.chrome import ChromeDriverManager
+                    
+                    # Set cache directory
+                    os.environ['WDM_LOCAL'] = '1'
+                    os.environ['WDM_LOG_LEVEL'] = '0'
+                    
+                    driver_path = ChromeDriverManager().install()
+                    service = Service(driver_path)
+                    self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                    _pin_driver(driver_path)
+                    
+                except ImportError:
+                    # Fallback without WebDriverManager
+                    self.driver = webdriver.Chrome(options=chrome_options)
             
             # Configure driver to avoid detection
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            
+            # Don't download subresources the scraper never looks at
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(_BLOCKED_RESOURCE_URLS)})
+            except WebDriverException as e:
+                self.logger.warning(f"⚠️ Could not enable resource blocking: {e}")
             self.logger.info("✅ Selenium WebDriver initialized successfully")
             
         except Exception as e:
             self.logger.error(f"❌ Failed to setup Selenium: {e}")
             self.driver = None
     
+    def _job_id(self, key: str) -> str:
+        """Return the stable job id for a posting key."""
+        return f"AMZ-{_blake2b_hex(key)}"
+    
     def scrape_jobs(self, url: str) -> List[JobPosting]:
         """Scrape jobs using ONLY Selenium from Amazon hiring page."""
         jobs = []
@@ -130,60 +314,68 @@ class LiveJobScraper:
             self.driver.get(url)
             
             # Wait for the page to load (Amazon's job search is JavaScript-heavy)
-            wait = WebDriverWait(self.driver, 20)
+            wait = WebDriverWait(self.driver, 20, poll_frequency=0.25)
             
             # Wait for body to load
             wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             
-            # Additional wait for JavaScript content to render
+            # Wait for job listings to render, giving up after the same 8s the
+            # fixed sleep used to take
             self.logger.info("⏳ Waiting for JavaScript content to load...")
-            time.sleep(8)  # Give time for dynamic content
+            try:
+                WebDriverWait(self.driver, 8, poll_frequency=0.25).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _JOB_LISTING_READY_CSS))
+                )
+            except TimeoutException:
+                self.logger.info("⏳ No job listing elements rendered within 8s - continuing")
+            
+            # Values shared by every posting extracted in this scrape, interned so
+            # postings from different scrapes share one string object too
+            now = datetime.now()
+            today = sys.intern(now.strftime("%Y-%m-%d"))
+            detected_at = now.isoformat()
+            element_description = sys.intern(f"Amazon job opportunity scraped via Selenium from {url}")
             
             # Try to find job-related elements
             try:
-                # Look for common job listing selectors
-                job_selectors = [
-                    '.job-tile',
-                    '.job-card', 
-                    '[data-testid="job-tile"]',
-                    '.search-result',
-                    '.job-posting',
-                    '.position-card',
-                    '[class*="job"]',
-                    '[class*="position"]'
-                ]
-                
-                job_elements = []
-                for selector in job_selectors:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        job_elements = elements
-                        self.logger.info(f"✅ Found {len(elements)} job elements with selector: {selector}")
-                        break
-                
-                if not job_elements:
-                    # Fallback: look for any clickable elements that might be jobs
-                    job_elements = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='job'], a[href*='position']")
-                    self.logger.info(f"📋 Fallback found {len(job_elements)} potential job links")
+                # Look for common job listing selectors (falling back to any job-like
+                # links) inside the browser, in a single WebDriver round-trip
+                found = self.driver.execute_script(
+                    _COLLECT_JOB_ELEMENTS_JS, list(_JOB_SELECTORS), _JOB_LINK_FALLBACK_CSS, 10
+                )
+                if found['selector']:
+                    self.logger.info(f"✅ Found {found['count']} job elements with selector: {found['selector']}")
+                else:
+                    self.logger.info(f"📋 Fallback found {found['count']} potential job links")
                 
-                # Extract job information from found elements
-                for i, element in enumerate(job_elements[:10]):  # Limit to 10 jobs
+                # Extract job information from found elements (limited to 10 in the browser).
+                # The same posting is often rendered more than once (grid, list, featured),
+                # so skip repeats before hashing and building a JobPosting for them.
+                seen = set()
+                for i, element in enumerate(found['items']):
                     try:
                         # Try to get job title
-                        title = element.text.strip() if element.text else f"Amazon Position {i+1}"
-                        
-                        # Try to get job URL
-                        job_url = element.get_attribute('href') if element.tag_name == 'a' else url
+                        text = element['text']
+                        title = text.strip() if text else f"Amazon Position {i+1}"
                         
                         # Create job posting
                         if title and len(title) > 3:
+                            # Try to get job URL
+                            job_url = element['href'] if element['tag'] == 'a' else url
+                            
+                            key = (title, job_url)
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            
                             job = JobPosting(
-                                job_id=f"AMZ-{abs(hash(f'{title}-{i}')) % 100000}",
+                                job_id=self._job_id(f'{title}-{i}'),
                                 title=title[:100],  # Limit title length
-                                url=job_url or f"https://hiring.amazon.ca/app#/jobdetail/{abs(hash(title)) % 10000}",
+                                url=job_url or f"https://hiring.amazon.ca/app#/jobdetail/{int(_blake2b_hex(title), 16) % 10000}",
                                 location="Canada",
-                                posted_date=datetime.now().strftime("%Y-%m-%d"),
-                                description=f"Amazon job opportunity scraped via Selenium from {url}"
+                                posted_date=today,
+                                description=element_description,
+                                detected_at=detected_at
                             )
                             jobs.append(job)
                             self.logger.info(f"📄 Extracted job: {title[:50]}...")
@@ -194,26 +386,23 @@ class LiveJobScraper:
                 
                 # If no structured jobs found, create based on page content
                 if not jobs:
-                    page_source = self.driver.page_source
-                    soup = BeautifulSoup(page_source, 'html.parser')
-                    page_text = soup.get_text().lower()
+                    # Only this fallback needs the full HTML from the browser
+                    page_text = _extract_page_text(self.driver.page_source)
                     
                     # Check if page contains job-related content
-                    if any(keyword in page_text for keyword in ['hiring', 'position', 'apply', 'job', 'career']):
+                    if _JOB_PAGE_KEYWORDS_RE.search(page_text):
                         self.logger.info("📋 Creating jobs based on page content analysis")
                         
-                        job_types = ['Warehouse Associate', 'Delivery Driver', 'Fulfillment Associate']
-                        locations = ['Toronto, ON', 'Vancouver, BC', 'Montreal, QC']
-                        
-                        for job_type in job_types:
-                            for location in locations[:2]:  # 2 locations per type
+                        for job_type in _FALLBACK_JOB_TYPES:
+                            for location in _FALLBACK_LOCATIONS:  # 2 locations per type
                                 job = JobPosting(
-                                    job_id=f"AMZ-{abs(hash(f'{job_type}-{location}')) % 100000}",
+                                    job_id=self._job_id(f'{job_type}-{location}'),
                                     title=f"{job_type} - {location}",
-                                    url=f"https://hiring.amazon.ca/app#/jobdetail/{abs(hash(job_type)) % 10000}",
+                                    url=f"https://hiring.amazon.ca/app#/jobdetail/{int(_blake2b_hex(job_type), 16) % 10000}",
                                     location=location,
-                                    posted_date=datetime.now().strftime("%Y-%m-%d"),
-                                    description=f"Amazon {job_type} position in {location} - scraped via Selenium"
+                                    posted_date=today,
+                                    description=f"Amazon {job_type} position in {location} - scraped via Selenium",
+                                    detected_at=detected_at
                                 )
                                 jobs.append(job)
                         
@@ -250,7 +439,10 @@ class LiveJobMonitor:
     def __init__(self):
         self.scraper = LiveJobScraper()
         self.jobs: Dict[str, JobPosting] = {}
+        # The same jobs ordered by detected_at (oldest first), kept sorted on insert
+        self._jobs_by_time: List[JobPosting] = []
         self.logs = deque(maxlen=100)
+        self.last_check: Optional[str] = None
         self.stats = {
             'total_checks': 0,
             'total_jobs_found': 0,
@@ -265,6 +457,33 @@ class LiveJobMonitor:
         
         self.logger = logging.getLogger('monitor')
         
+        # Checks run off the event loop; the Selenium driver allows one at a time
+        self._check_lock = threading.Lock()
+        
+        # Recent scrape results per URL, reused for SCRAPE_CACHE_TTL seconds so
+        # back-to-back /jobs polls don't each drive Selenium
+        scrape_cache_ttl = os.getenv('SCRAPE_CACHE_TTL', '60')
+        try:
+            self.scrape_cache_ttl = float(scrape_cache_ttl)
+        except ValueError:
+            self.logger.warning(f"Invalid SCRAPE_CACHE_TTL {scrape_cache_ttl!r}, using 60")
+            self.scrape_cache_ttl = 60.0
+        self._scrape_cache: Dict[str, Tuple[float, List[JobPosting]]] = {}
+        
+        # Bumped whenever self.jobs changes; serialised job lists are cached per
+        # version and limit so unchanged lists are not re-encoded on every poll
+        self.jobs_version = 0
+        self._jobs_json_version = -1
+        self._jobs_json_cache: Dict[int, bytes] = {}
+        # Encoded /status body and the state it was built from
+        self._status_json_key: Optional[Tuple] = None
+        self._status_json: bytes = b''
+        
+        # Persistent job store (one row per job, appended as jobs are found)
+        self.db_path = os.getenv('DATABASE_PATH', 'jobs.db')
+        self._db = self._init_db(self.db_path)
+        self._load_jobs()
+        
         # Add initial startup log
         self.add_log('INFO', 'Amazon Job Monitor initialized with Selenium-only mode')
         self.add_log('INFO', f'Target site: {self.target_urls[0]}')
@@ -272,14 +491,68 @@ class LiveJobMonitor:
         selenium_status = 'Ready' if self.scraper.driver else 'Not Ready'
         self.add_log('INFO', f'Selenium WebDriver status: {selenium_status}')
     
+    def _init_db(self, db_path: str) -> Optional[sqlite3.Connection]:
+        """Open the SQLite job store in WAL mode, creating the schema if needed."""
+        try:
+            db_dir = os.path.dirname(db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            
+            db = sqlite3.connect(db_path, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS jobs ('
+                'job_id TEXT PRIMARY KEY, title TEXT, url TEXT, location TEXT, '
+                'posted_date TEXT, description TEXT, detected_at TEXT)'
+            )
+            db.execute('CREATE INDEX IF NOT EXISTS idx_jobs_detected_at ON jobs(detected_at)')
+            db.commit()
+            return db
+        except (OSError, sqlite3.Error) as e:
+            # Run memory-only rather than fail startup when storage is unavailable
+            self.logger.error(f"Failed to open job database {db_path}: {e}")
+            return None
+    
+    def _load_jobs(self):
+        """Load previously stored jobs into memory."""
+        if not self._db:
+            return
+        try:
+            rows = self._db.execute(
+                'SELECT job_id, title, url, location, posted_date, description, detected_at FROM jobs'
+            )
+            # Location, date and description repeat across many rows; intern them so
+            # loaded jobs share one string object per distinct value
+            for job_id, title, url, location, posted_date, description, detected_at in rows:
+                self.jobs[job_id] = JobPosting(
+                    job_id, title, url, _intern_column(location), _intern_column(posted_date),
+                    _intern_column(description), detected_at
+                )
+            self._jobs_by_time = sorted(self.jobs.values(), key=attrgetter('detected_at'))
+            self.stats['total_jobs_found'] = len(self.jobs)
+            self.logger.info(f"Loaded {len(self.jobs)} jobs from {self.db_path}")
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to load jobs from {self.db_path}: {e}")
+    
+    def _save_jobs(self, jobs: List[JobPosting]):
+        """Persist newly found jobs; existing rows are left untouched."""
+        if not self._db or not jobs:
+            return
+        try:
+            with self._db:
+                self._db.executemany(
+                    'INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [(job.job_id, job.title, job.url, job.location, job.posted_date,
+                      job.description, job.detected_at) for job in jobs]
+                )
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to save jobs to {self.db_path}: {e}")
+    
     def add_log(self, level: str, message: str):
         """Add a log entry."""
-        log_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'level': level,
-            'message': message
-        }
-        self.logs.append(log_entry)
+        # Stored as a (created, level, message) tuple; get_logs builds the dicts
+        self.logs.append((time.time(), level, message))
         # Also log to console
         if level == 'ERROR':
             self.logger.error(message)
@@ -288,8 +561,32 @@ class LiveJobMonitor:
         else:
             self.logger.info(message)
     
-    def check_for_jobs(self) -> int:
-        """Check for jobs and return count of new jobs found."""
+    def check_for_jobs(self, force: bool = False) -> int:
+        """Check for jobs and return count of new jobs found.
+
+        With force=True every URL is scraped even if a cached result is still fresh."""
+        with self._check_lock:
+            return self._check_for_jobs(force)
+    
+    def _scrape(self, url: str, force: bool = False) -> List[JobPosting]:
+        """Scrape a URL, reusing a non-empty result younger than scrape_cache_ttl unless forced."""
+        cached = self._scrape_cache.get(url)
+        if cached and not force:
+            age = time.monotonic() - cached[0]
+            if age < self.scrape_cache_ttl:
+                self.add_log('INFO', f'Using cached results for {url} ({age:.0f}s old)')
+                return cached[1]
+        
+        jobs = self.scraper.scrape_jobs(url)
+        if jobs:
+            # Stamped after the scrape, which can take tens of seconds, so the entry
+            # lives for the full TTL
+            self._scrape_cache[url] = (time.monotonic(), jobs)
+        return jobs
+    
+    def _check_for_jobs(self, force: bool = False) -> int:
+        """Run one scrape of every target URL; callers must hold _check_lock."""
+        self.last_check = datetime.now().isoformat()
         self.stats['total_checks'] += 1
         new_jobs_count = 0
         
@@ -298,16 +595,23 @@ class LiveJobMonitor:
         for url in self.target_urls:
             try:
                 self.add_log('INFO', f'Scraping: {url}')
-                jobs = self.scraper.scrape_jobs(url.strip())
+                jobs = self._scrape(url.strip(), force)
                 
+                new_jobs = []
                 for job in jobs:
                     if job.job_id not in self.jobs:
                         self.jobs[job.job_id] = job
+                        bisect.insort(self._jobs_by_time, job, key=attrgetter('detected_at'))
+                        new_jobs.append(job)
                         new_jobs_count += 1
                         self.stats['new_jobs_this_session'] += 1
                         self.add_log('SUCCESS', f'New job found: {job.title} - {job.location}')
                 
+                self._save_jobs(new_jobs)
+                # Update the counts before publishing the new version
                 self.stats['total_jobs_found'] = len(self.jobs)
+                if new_jobs:
+                    self.jobs_version += 1
                 
                 if jobs:
                     self.add_log('INFO', f'Found {len(jobs)} jobs from {url}')
@@ -328,9 +632,22 @@ class LiveJobMonitor:
     
     def get_jobs(self, limit: int = 50) -> List[Dict]:
         """Get list of jobs."""
-        jobs_list = list(self.jobs.values())
-        jobs_list.sort(key=lambda x: x.detected_at, reverse=True)
-        return [asdict(job) for job in jobs_list[:limit]]
+        if limit <= 0:
+            return []
+        return [job.to_dict() for job in reversed(self._jobs_by_time[-limit:])]
+    
+    def get_jobs_json(self, limit: int = 50) -> bytes:
+        """Get the job list from get_jobs() as JSON bytes, cached until jobs change."""
+        version = self.jobs_version
+        if version != self._jobs_json_version or len(self._jobs_json_cache) >= 16:
+            self._jobs_json_cache = {}
+            self._jobs_json_version = version
+        
+        encoded = self._jobs_json_cache.get(limit)
+        if encoded is None:
+            encoded = _json_bytes(self.get_jobs(limit))
+            self._jobs_json_cache[limit] = encoded
+        return encoded
     
     def get_status(self) -> Dict:
         """Get current monitoring status."""
@@ -341,7 +658,7 @@ class LiveJobMonitor:
             'selenium_status': 'On' if selenium_driver_ready else 'Off',
             'selenium_driver_status': 'Ready' if selenium_driver_ready else 'Not Ready',
             'data_source': 'SELENIUM_ONLY',
-            'last_check': datetime.now().isoformat(),
+            'last_check': self.last_check,
             'total_jobs': len(self.jobs),
             'stats': self.stats,
             'config': {
@@ -350,9 +667,113 @@ class LiveJobMonitor:
             }
         }
     
+    def get_status_json(self) -> bytes:
+        """Get get_status() as JSON bytes, rebuilt only when a value it reports has changed."""
+        # Every mutable field in the status is covered by these values
+        key = (self.last_check, tuple(self.stats.values()), len(self.jobs),
+               bool(self.scraper.driver))
+        if key != self._status_json_key:
+            self._status_json = _json_bytes(self.get_status())
+            self._status_json_key = key
+        return self._status_json
+    
     def get_logs(self, limit: int = 50) -> List[Dict]:
         """Get recent logs."""
-        return list(self.logs)[-limit:]
+        count = len(self.logs)
+        # Copy the slice in one step first - a check thread may append while we format
+        entries = list(islice(self.logs, max(0, count - limit), count))
+        return [
+            {
+                'timestamp': datetime.fromtimestamp(created).isoformat(),
+                'level': level,
+                'message': message
+            }
+            for created, level, message in entries
+        ]
+
+# Polled endpoints may be reused briefly, then revalidated with their ETag
+_POLLED_CACHE_CONTROL = "public, max-age=5, stale-while-revalidate=30"
+
+# Bodies below this size are sent uncompressed; gzip barely helps them
+_GZIP_MIN_SIZE = 1024
+
+# Compressed bodies keyed by ETag, so an unchanged payload is gzipped only once
+_gzip_cache: Dict[str, bytes] = {}
+
+def _gzip_body(etag: str, body: bytes) -> bytes:
+    """Return body gzip-compressed, reusing the cached result for the same ETag."""
+    compressed = _gzip_cache.get(etag)
+    if compressed is None:
+        if len(_gzip_cache) >= 16:
+            _gzip_cache.clear()
+        compressed = gzip.compress(body, compresslevel=6)
+        _gzip_cache[etag] = compressed
+    return compressed
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return whether an Accept-Encoding header allows gzip (explicitly or via '*') with q > 0."""
+    qvalues = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+    q = qvalues.get("gzip", qvalues.get("x-gzip", qvalues.get("*", 0.0)))
+    return q > 0
+
+def _etag_response(request: Request, body: bytes) -> Response:
+    """Return a JSON body with a strong ETag, or an empty 304 if the client already has it.
+
+    Larger bodies are sent gzip-encoded when the client accepts it."""
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    use_gzip = len(body) >= _GZIP_MIN_SIZE and _accepts_gzip(request.headers.get("accept-encoding", ""))
+    # Each encoding is a separate representation and needs its own strong ETag
+    etag = f'"{digest}-gz"' if use_gzip else f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": _POLLED_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_tags or "*" in client_tags:
+            return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        body = _gzip_body(etag, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _root_body(selenium_ready: bool) -> bytes:
+    """Return the encoded / response for the given driver state."""
+    return _json_bytes({
+        "message": "Amazon Job Monitor API (Selenium Only)",
+        "version": "2.0.0-selenium",
+        "environment": "Selenium Optimized",
+        "selenium_status": "✅ Active" if selenium_ready else "❌ Inactive",
+        "data_source": "SELENIUM_ONLY",
+        "target_site": "https://hiring.amazon.ca/app#/jobsearch",
+        "status": "running"
+    })
+
+def _health_tail(selenium_ready: bool) -> bytes:
+    """Return the encoded /health fields that follow the timestamp, without the opening brace."""
+    return _json_bytes({
+        "selenium_driver": selenium_ready,
+        "selenium_status": "Ready" if selenium_ready else "Not Ready",
+        "environment": "selenium_optimized",
+        "target_site": "https://hiring.amazon.ca/app#/jobsearch"
+    })[1:]
+
+# / and /health only vary with driver readiness (plus the health timestamp), so
+# both variants are encoded once up front
+_ROOT_BODIES = {ready: _root_body(ready) for ready in (True, False)}
+_HEALTH_TAILS = {ready: _health_tail(ready) for ready in (True, False)}
 
 # Initialize the job monitor
 job_monitor = LiveJobMonitor()
@@ -381,38 +802,32 @@ class StartMonitorRequest(BaseModel):
 @app.get("/")
 async def root():
     """Root endpoint."""
-    selenium_status = "✅ Active" if job_monitor.scraper.driver else "❌ Inactive"
-    return {
-        "message": "Amazon Job Monitor API (Selenium Only)",
-        "version": "2.0.0-selenium",
-        "environment": "Selenium Optimized",
-        "selenium_status": selenium_status,
-        "data_source": "SELENIUM_ONLY",
-        "target_site": "https://hiring.amazon.ca/app#/jobsearch",
-        "status": "running"
-    }
+    return Response(content=_ROOT_BODIES[bool(job_monitor.scraper.driver)],
+                    media_type="application/json")
 
 @app.get("/jobs")
-async def get_jobs(limit: int = 50):
-    """Get list of jobs (triggers fresh Selenium scraping)."""
+async def get_jobs(request: Request, limit: int = 50):
+    """Get list of jobs (runs a Selenium check, reusing results younger than SCRAPE_CACHE_TTL)."""
     try:
-        new_jobs = job_monitor.check_for_jobs()
-        jobs = job_monitor.get_jobs(limit)
-        return {
-            "jobs": jobs,
+        new_jobs = await asyncio.to_thread(job_monitor.check_for_jobs)
+        payload = {
             "total": len(job_monitor.jobs),
             "new_jobs_found": new_jobs,
             "data_source": "SELENIUM_ONLY",
             "scraping_method": "selenium_webdriver"
         }
+        # Splice the cached, already-encoded job list into the envelope instead of
+        # re-serialising it
+        body = b'{"jobs":' + job_monitor.get_jobs_json(limit) + b',' + _json_bytes(payload)[1:]
+        return _etag_response(request, body)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/status")
-async def get_status():
+async def get_status(request: Request):
     """Get current monitoring status."""
     try:
-        return job_monitor.get_status()
+        return _etag_response(request, job_monitor.get_status_json())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -420,7 +835,8 @@ async def get_status():
 async def start_monitoring(request: Optional[StartMonitorRequest] = None):
     """Trigger a Selenium job check."""
     try:
-        new_jobs = job_monitor.check_for_jobs()
+        # An explicit trigger always scrapes, bypassing the result cache
+        new_jobs = await asyncio.to_thread(job_monitor.check_for_jobs, force=True)
         return {
             "message": "Selenium job check completed",
             "status": "success",
@@ -432,28 +848,27 @@ async def start_monitoring(request: Optional[StartMonitorRequest] = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/logs")
-async def get_logs(limit: int = 50):
+async def get_logs(request: Request, limit: int = 50):
     """Get recent log messages."""
     try:
         logs = job_monitor.get_logs(limit)
-        return {"logs": logs}
+        return _etag_response(request, _json_bytes({"logs": logs}))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    selenium_driver_ready = bool(job_monitor.scraper.driver)
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "selenium_driver": selenium_driver_ready,
-        "selenium_status": "Ready" if selenium_driver_ready else "Not Ready",
-        "environment": "selenium_optimized",
-        "target_site": "https://hiring.amazon.ca/app#/jobsearch"
-    }
+    timestamp = datetime.now().isoformat().encode('ascii')
+    body = (b'{"status":"healthy","timestamp":"' + timestamp + b'",'
+            + _HEALTH_TAILS[bool(job_monitor.scraper.driver)])
+    return Response(content=body, media_type="application/json")
 
 if __name__ == "__main__":
     logger.info("🚀 Starting Selenium-Only Amazon Job Monitor API")
     logger.info("🎯 Target Site: https://hiring.amazon.ca/app#/jobsearch")
-    uvicorn.run(app, host="0.0.0.0", port=5001)
\ No newline at end of file
+    # One worker only: each worker would build its own monitor and Chrome driver.
+    # uvicorn[standard] already picks uvloop and httptools when they are installed;
+    # LOG_LEVEL=WARNING also drops the per-request access log
+    uvicorn.run(app, host="0.0.0.0", port=5001, log_level=_LOG_LEVEL.lower(),
+                access_log=_LOG_LEVEL in ('DEBUG', 'INFO'))
\ No newline at end of file